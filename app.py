@@ -1,8 +1,14 @@
 # --------------------------------------------------------------
 # app.py – IPv4 Subnet Calculator
 # --------------------------------------------------------------
+import functools
 import os
+import re
 import ipaddress
+from collections import namedtuple
+from dataclasses import dataclass
+from socket import inet_ntoa
+from struct import Struct
 from flask import Flask, render_template, request
 
 # ------------------------------------------------------------------
@@ -18,12 +24,70 @@ app = Flask(__name__, root_path=root_path)
 ITEMS_PER_PAGE = 20
 PAGES_BEFORE_AFTER = 10
 
+# Byte-value lookup tables - formatting octets via f-strings dominates
+# rendering for large subnet windows, so map byte -> string once at import
+_BIN8 = tuple(f"{b:08b}" for b in range(256))
+_DEC = tuple(str(b) for b in range(256))
+
+# Binary netmask string per prefix length - only 33 distinct masks exist
+_BINARY_MASK = tuple(
+    ".".join(_BIN8[(m >> s) & 0xFF] for s in (24, 16, 8, 0))
+    for m in ((0xFFFFFFFF << (32 - p)) & 0xFFFFFFFF for p in range(33))
+)
+
+# IP class by first octet: 0-127 A, 128-191 B, 192-223 C, 224-239 D, 240-255 E
+_CLASS = "A" * 128 + "B" * 64 + "C" * 32 + "D" * 16 + "E" * 16
+
+# Input classifiers - dispatch on shape up front instead of letting
+# ipaddress raise on every malformed or mismatched format
+_IP_MASK_RE = re.compile(r"^(\d{1,3}(?:\.\d{1,3}){3})\s+(\d{1,3}(?:\.\d{1,3}){3})$", re.ASCII)
+_IP_RE = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$", re.ASCII)
+
 # ------------------------------------------------------------------
 # Helper functions
 # ------------------------------------------------------------------
+def _parse_ip(s):
+    """Parse a dotted-decimal IPv4 string to a 32-bit int, or None.
+
+    Hand-rolled fast path for well-formed user input - skips the heavier
+    IPv4Address validation machinery. Mirrors ipaddress strictness:
+    octets must be 0-255 with no leading zeros.
+    """
+    parts = s.split(".")
+    if len(parts) != 4:
+        return None
+    ip = 0
+    for part in parts:
+        if not (part.isascii() and part.isdigit()) or (len(part) > 1 and part[0] == "0"):
+            return None
+        v = int(part)
+        if v > 255:
+            return None
+        ip = (ip << 8) | v
+    return ip
+
+
+# Compiled once - Struct caches the parsed format string, so each call
+# is a plain method invocation instead of a format-string parse
+_pack_u32 = Struct("!I").pack
+
+
+def _dotted(x):
+    """Format a 32-bit integer as a dotted-decimal string.
+
+    inet_ntoa is a thin wrapper over the libc routine - one C call beats
+    four Python-level shift/mask/format steps per address.
+    """
+    return inet_ntoa(_pack_u32(x))
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_input(input_str):
     """Parse input that can be CIDR notation, IP with subnet mask, or IP with wildcard mask.
-    
+
+    Results are memoized - pagination re-submits the same string on every
+    page flip, and IPv4Network objects are immutable and hashable.
+
     Accepts:
     - CIDR notation: 192.168.1.1/24
     - IP with subnet mask: 192.168.1.1 255.255.255.0
@@ -33,48 +97,57 @@ def parse_input(input_str):
         return None
     
     input_str = input_str.strip()
-    
-    try:
-        # Check if it's CIDR notation (contains /)
-        if "/" in input_str:
+
+    # CIDR notation (prefix, netmask or hostmask after the slash) - let
+    # ipaddress do the validation, it accepts all three forms
+    if "/" in input_str:
+        try:
             return ipaddress.IPv4Network(input_str, strict=False)
-        
-        # Try to parse as IP with mask (space-separated)
-        parts = input_str.split()
-        if len(parts) == 2:
-            ip_part = parts[0].strip()
-            mask_part = parts[1].strip()
-            
-            # First, try to parse as subnet mask (default behavior)
-            try:
-                return ipaddress.IPv4Network(f"{ip_part}/{mask_part}", strict=False)
-            except (ValueError, ipaddress.AddressValueError):
-                # If that fails, try to parse as wildcard mask
-                try:
-                    wildcard = ipaddress.IPv4Address(mask_part)
-                    # Convert wildcard mask to subnet mask: subnet = 255.255.255.255 - wildcard
-                    subnet_int = 0xFFFFFFFF - int(wildcard)
-                    subnet_mask = ipaddress.IPv4Address(subnet_int)
-                    # Use the subnet mask to create the network
-                    return ipaddress.IPv4Network(f"{ip_part}/{subnet_mask}", strict=False)
-                except (ValueError, ipaddress.AddressValueError):
-                    return None
-        
-        # If single value, default to /32
-        return ipaddress.IPv4Network(f"{input_str}/32", strict=False)
-    except (ValueError, ipaddress.AddressValueError):
-        return None
+        except (ValueError, ipaddress.AddressValueError):
+            return None
 
+    # IP with mask (space-separated) - classify the mask numerically
+    # instead of attempting a subnet parse and falling back on ValueError.
+    # A subnet mask is a contiguous run of high 1-bits (its inverse has
+    # contiguous low 1-bits), a wildcard mask is the opposite; anything
+    # else is invalid. Subnet interpretation wins when both apply
+    # (0.0.0.0 and 255.255.255.255), matching the original try-order
+    match = _IP_MASK_RE.match(input_str)
+    if match:
+        ip_part, mask_part = match.groups()
+        ip_int = _parse_ip(ip_part)
+        m = _parse_ip(mask_part)
+        if ip_int is None or m is None:
+            return None
 
-def _get_supernet_to_prefix(net, target_prefix):
-    """Get the supernet of a network up to a target prefix length."""
-    current = net
-    while current.prefixlen > target_prefix:
-        try:
-            current = current.supernet()
-        except ValueError:
-            break
-    return current
+        inv = m ^ 0xFFFFFFFF
+        if inv & (inv + 1) == 0:
+            netmask_int = m
+        elif m & (m + 1) == 0:
+            netmask_int = inv
+        else:
+            return None
+
+        prefix = 32 - (netmask_int ^ 0xFFFFFFFF).bit_length()
+        return ipaddress.IPv4Network((ip_int, prefix), strict=False)
+
+    # If single value, default to /32
+    if _IP_RE.match(input_str):
+        ip_int = _parse_ip(input_str)
+        if ip_int is not None:
+            return ipaddress.IPv4Network((ip_int, 32))
+
+    return None
+
+
+def _supernet_to(net, target_prefix):
+    """Get the supernet of a network at a target prefix length.
+
+    Zeroing the host bits directly avoids the one-allocation-per-step
+    supernet() walk; the (int, prefix) constructor form skips string parsing.
+    """
+    mask = (0xFFFFFFFF << (32 - target_prefix)) & 0xFFFFFFFF
+    return ipaddress.IPv4Network((int(net.network_address) & mask, target_prefix))
 
 
 def get_parent_network(net):
@@ -94,18 +167,17 @@ def get_parent_network(net):
     - 192.168.10.1/19 -> 192.168.0.0/16 (192.168.*.*)
     - 192.168.1.1/15 -> 192.0.0.0/8 (192.*.*.*)
     """
-    first = net.network_address.packed[0]
-    
     # Determine target boundaries based on prefix length
     if net.prefixlen > 24:
-        return _get_supernet_to_prefix(net, 24)
+        return _supernet_to(net, 24)
     elif net.prefixlen > 16:
-        return _get_supernet_to_prefix(net, 16)
+        return _supernet_to(net, 16)
     elif net.prefixlen > 8:
-        return _get_supernet_to_prefix(net, 8)
+        return _supernet_to(net, 8)
     else:
         # Prefixlen <= 8, use /8 network
-        return ipaddress.IPv4Network(f"{first}.0.0.0/8")
+        first = net.network_address.packed[0]
+        return ipaddress.IPv4Network((first << 24, 8))
 
 
 def get_host_range(net):
@@ -117,14 +189,56 @@ def get_host_range(net):
 
 def wildcard_network(net):
     """Generate wildcard network representation (e.g., 10.100.*.*)."""
-    octets = net.network_address.exploded.split(".")
-    mask_octets = net.netmask.exploded.split(".")
-    return ".".join(oct if mask == "255" else "*" for oct, mask in zip(octets, mask_octets))
+    return ".".join(
+        _DEC[a] if m == 255 else "*"
+        for a, m in zip(net.network_address.packed, net.netmask.packed)
+    )
+
+
+# Column container for the subnet window (see the SoA note in
+# _format_ipcalc_cached) - a namedtuple resolves template attribute
+# access directly and fixes the field set, unlike a plain dict
+SubnetWindow = namedtuple(
+    "SubnetWindow", ("network", "range", "broadcast", "is_current", "index", "page")
+)
+
+
+@dataclass(slots=True)
+class IpcalcResult:
+    """Calculation result handed to the template.
+
+    Slotted so the many instances held by the result cache stay compact;
+    Jinja reads the fields via attribute access just like dict keys.
+    """
+    network: str
+    host_min: str
+    host_max: str
+    broadcast: str
+    hosts_usable: str
+    netmask: str
+    wildcard: str
+    binary_mask: str
+    ip_class: str
+    cidr_full: str
+    ip_type: str
+    binary_id: str
+    in_addr: str
+    vertical: str
+    items_per_page: int
+    total_pages: int
+    all_nets: SubnetWindow
+    parent_desc: str
+    show_subnet_list: bool
+    current_page: int
+    total_subnets: int
+    window_start_page: int
+    window_end_page: int
+    current_index: int
 
 
 def format_ipcalc(net, requested_page=None):
     """Format network information for display.
-    
+
     Args:
         net: IPv4Network object
         requested_page: Optional page number to center the window on
@@ -132,120 +246,79 @@ def format_ipcalc(net, requested_page=None):
     if not net:
         return None
 
+    # Normalize the page to a hashable key so repeated submissions of the
+    # same network (pagination clicks) hit the cache
+    try:
+        page = int(requested_page) if requested_page else None
+    except (ValueError, TypeError):
+        page = None
+
+    return _format_ipcalc_cached(int(net.network_address), net.prefixlen, page)
+
+
+@functools.lru_cache(maxsize=2048)
+def _invariants(net_int, prefix):
+    """Page-independent portion of format_ipcalc, cached per network.
+
+    Everything except the subnet window is the same no matter which page
+    the user is looking at, so compute it once per (network, prefix) and
+    let pagination requests reuse it. Returns (fields, window) where
+    fields go straight into the response dict and window carries the
+    parameters the per-page subnet generation needs.
+    """
+    net = ipaddress.IPv4Network((net_int, prefix))
+
     # Host calculations
     hosts_total = net.num_addresses
     hosts_usable = max(0, hosts_total - 2)
     host_min, host_max = get_host_range(net)
 
-    # Masks
-    wildcard = ipaddress.IPv4Address(int(net.netmask) ^ 0xFFFFFFFF)
-    binary_mask = ".".join(f"{b:08b}" for b in net.netmask.packed)
+    # Masks - only the dotted string is needed, so skip the IPv4Address
+    # round-trip and format the XOR result directly
+    wildcard_str = _dotted(int(net.netmask) ^ 0xFFFFFFFF)
+    binary_mask = _BINARY_MASK[prefix]
 
     # Class and type
-    first_octet = net.network_address.packed[0]
-    ip_class = (
-        "A" if first_octet <= 127 else
-        "B" if first_octet <= 191 else
-        "C" if first_octet <= 223 else
-        "D" if first_octet <= 239 else "E"
-    )
+    ip_class = _CLASS[net.network_address.packed[0]]
     ip_type = "Private" if net.is_private else "Public"
 
     # IDs
-    binary_id = ".".join(f"{b:08b}" for b in net.network_address.packed)
-    rev_octets = ".".join(str(o) for o in reversed(net.network_address.packed))
-    in_addr = f"{rev_octets}.in-addr.arpa"
+    binary_id = ".".join(_BIN8[b] for b in net.network_address.packed)
+    p = net.network_address.packed
+    in_addr = f"{_DEC[p[3]]}.{_DEC[p[2]]}.{_DEC[p[1]]}.{_DEC[p[0]]}.in-addr.arpa"
 
-    # Subnet list with lazy loading (window of pages around current)
+    # Subnet-list parameters (the window itself is page-dependent)
     parent = get_parent_network(net)
     show_subnet_list = parent.prefixlen < net.prefixlen
-    
-    # Initialize defaults
-    all_nets = []
-    current_index = 0
-    current_page = 1
-    start_page = 1
-    end_page = 1
+    subnet_size = 1 << (32 - prefix)
+    parent_int = int(parent.network_address)
     total_subnets = 0
     total_pages = 1
-
+    current_index = 0
     if show_subnet_list:
-        try:
-            # Calculate total number of subnets (calculate once, reuse)
-            prefix_diff = net.prefixlen - parent.prefixlen
-            total_subnets = 2 ** prefix_diff if prefix_diff > 0 else 0
-            total_pages = max(1, (total_subnets + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE)
-            
-            # Calculate current network's index directly
-            subnet_size = 2 ** (32 - net.prefixlen)
-            current_index = (int(net.network_address) - int(parent.network_address)) // subnet_size
-            
-            # Calculate page window - use requested page if provided, otherwise use current network's page
-            if requested_page:
-                try:
-                    center_page = max(1, min(int(requested_page), total_pages))
-                except (ValueError, TypeError):
-                    center_page = (current_index // ITEMS_PER_PAGE) + 1
-            else:
-                center_page = (current_index // ITEMS_PER_PAGE) + 1
-            
-            # Center window on the requested/current page
-            start_page = max(1, center_page - PAGES_BEFORE_AFTER)
-            end_page = min(total_pages, center_page + PAGES_BEFORE_AFTER)
-            current_page = center_page
-            
-            # Calculate index range to generate
-            start_index = (start_page - 1) * ITEMS_PER_PAGE
-            end_index = min(total_subnets, end_page * ITEMS_PER_PAGE)
-            
-            # Generate only the window of subnets needed using direct calculation
-            for idx in range(start_index, end_index):
-                network_int = int(parent.network_address) + (idx * subnet_size)
-                subnet_addr = ipaddress.IPv4Address(network_int)
-                subnet = ipaddress.IPv4Network(f"{subnet_addr}/{net.prefixlen}", strict=False)
-                
-                sub_min, sub_max = get_host_range(subnet)
-                subnet_page = (idx // ITEMS_PER_PAGE) + 1
-                all_nets.append({
-                    "network": str(subnet.network_address),
-                    "range": f"{sub_min} - {sub_max}",
-                    "broadcast": str(subnet.broadcast_address),
-                    "is_current": subnet == net,
-                    "index": idx,
-                    "page": subnet_page,
-                })
-        except (ValueError, MemoryError):
-            show_subnet_list = False
-            all_nets = []
+        prefix_diff = prefix - parent.prefixlen
+        total_subnets = 1 << prefix_diff if prefix_diff > 0 else 0
+        total_pages = max(1, (total_subnets + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE)
+        current_index = (net_int - parent_int) // subnet_size
 
-    if not show_subnet_list:
-        # Show only the current network
-        all_nets = [{
-            "network": str(net.network_address),
-            "range": f"{host_min} - {host_max}",
-            "broadcast": str(net.broadcast_address),
-            "is_current": True,
-            "index": 0,
-            "page": 1,
-        }]
+    # Row shown when no subnet list applies (also the error fallback).
+    # all_nets is column-oriented: one list per field rather than one
+    # dict per row, which keeps per-render object count flat
+    single_net = SubnetWindow(
+        network=[str(net.network_address)],
+        range=[f"{host_min} - {host_max}"],
+        broadcast=[str(net.broadcast_address)],
+        is_current=[True],
+        index=[0],
+        page=[1],
+    )
 
     # Description - use total count, not window count
-    if show_subnet_list:
-        count = total_subnets
-        parent_desc = (
-            f"All {count:,} Possible /{net.prefixlen} Networks in {wildcard_network(parent)}"
-            if count > 1 else f"Network: {net}"
-        )
-    else:
-        count = len(all_nets)
-        parent_desc = (
-            f"All {count:,} Possible /{net.prefixlen} Networks in {wildcard_network(net)}"
-            if count > 1 else f"Network: {net}"
-        )
-    
-    # Pagination - values already calculated above for show_subnet_list case
-    window_start_page = start_page
-    window_end_page = end_page
+    parent_desc_list = (
+        f"All {total_subnets:,} Possible /{prefix} Networks in {wildcard_network(parent)}"
+        if total_subnets > 1 else f"Network: {net}"
+    )
+    parent_desc_single = f"Network: {net}"
 
     # ---- copy‑summary (vertical) -------------------------------------------
     vertical = (
@@ -253,7 +326,7 @@ def format_ipcalc(net, requested_page=None):
         f"Binary ID: {binary_id}\n"
         f"Subnet Mask: {net.netmask}\n"
         f"Binary Subnet Mask: {binary_mask}\n"
-        f"Wildcard Mask: {wildcard}\n"
+        f"Wildcard Mask: {wildcard_str}\n"
         f"Broadcast Address: {net.broadcast_address}\n"
         f"CIDR Notation: {net.network_address}/{net.prefixlen}\n"
         f"Usable Host IP Range: {host_min} - {host_max}\n"
@@ -263,34 +336,114 @@ def format_ipcalc(net, requested_page=None):
         f"in-addr.arpa: {in_addr}"
     )
 
-    # Return dict for template
-    cidr_full = f"{net.network_address}/{net.prefixlen}"
-    return {
+    fields = {
         "network": str(net.network_address),
         "host_min": str(host_min),
         "host_max": str(host_max),
         "broadcast": str(net.broadcast_address),
         "hosts_usable": f"{hosts_usable:,}",
         "netmask": str(net.netmask),
-        "wildcard": str(wildcard),
+        "wildcard": wildcard_str,
         "binary_mask": binary_mask,
         "ip_class": ip_class,
-        "cidr_full": cidr_full,
+        "cidr_full": f"{net.network_address}/{net.prefixlen}",
         "ip_type": ip_type,
         "binary_id": binary_id,
         "in_addr": in_addr,
-        "all_nets": all_nets,
-        "parent_desc": parent_desc,
-        "show_subnet_list": show_subnet_list,
         "vertical": vertical,
         "items_per_page": ITEMS_PER_PAGE,
         "total_pages": total_pages,
-        "current_page": current_page,
-        "total_subnets": total_subnets if show_subnet_list else len(all_nets),
-        "window_start_page": window_start_page if show_subnet_list else 1,
-        "window_end_page": window_end_page if show_subnet_list else 1,
-        "current_index": current_index if show_subnet_list else 0,
     }
+    window = {
+        "show": show_subnet_list,
+        "parent_int": parent_int,
+        "subnet_size": subnet_size,
+        "total_subnets": total_subnets,
+        "total_pages": total_pages,
+        "current_index": current_index,
+        "single_net": single_net,
+        "desc_list": parent_desc_list,
+        "desc_single": parent_desc_single,
+    }
+    return fields, window
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_ipcalc_cached(net_int, prefix, page):
+    """Cached core of format_ipcalc, keyed on (network int, prefix, page)."""
+    fields, window = _invariants(net_int, prefix)
+
+    show_subnet_list = window["show"]
+    all_nets = None
+    current_page = 1
+    start_page = 1
+    end_page = 1
+    total_subnets = window["total_subnets"]
+    total_pages = window["total_pages"]
+    current_index = window["current_index"]
+
+    if show_subnet_list:
+        try:
+            # Calculate page window - use requested page if provided, otherwise use current network's page
+            if page is not None:
+                center_page = max(1, min(page, total_pages))
+            else:
+                center_page = (current_index // ITEMS_PER_PAGE) + 1
+
+            # Center window on the requested/current page
+            start_page = max(1, center_page - PAGES_BEFORE_AFTER)
+            end_page = min(total_pages, center_page + PAGES_BEFORE_AFTER)
+            current_page = center_page
+
+            # Calculate index range to generate
+            start_index = (start_page - 1) * ITEMS_PER_PAGE
+            end_index = min(total_subnets, end_page * ITEMS_PER_PAGE)
+
+            # Generate only the window of subnets needed using plain 32-bit
+            # integer arithmetic - constructing IPv4Network/IPv4Address objects
+            # per subnet re-runs full parsing/validation and dominates the loop.
+            # The window is built column-by-column (SoA) instead of one dict
+            # per row: ~6 lists of strings versus ~420 six-key dicts per
+            # render. Host-range offsets are constant across the window
+            # (mirroring get_host_range for /31 and /32), so the branch is
+            # taken once instead of per subnet
+            parent_int = window["parent_int"]
+            subnet_size = window["subnet_size"]
+            idxs = range(start_index, end_index)
+            net_ints = [parent_int + idx * subnet_size for idx in idxs]
+            bcast_off = subnet_size - 1
+            if subnet_size > 2:
+                min_off, max_off = 1, subnet_size - 2
+            else:
+                min_off, max_off = 0, 0
+            all_nets = SubnetWindow(
+                network=[_dotted(n) for n in net_ints],
+                range=[f"{_dotted(n + min_off)} - {_dotted(n + max_off)}" for n in net_ints],
+                broadcast=[_dotted(n + bcast_off) for n in net_ints],
+                is_current=[n == net_int for n in net_ints],
+                index=list(idxs),
+                page=[(idx // ITEMS_PER_PAGE) + 1 for idx in idxs],
+            )
+        except (ValueError, MemoryError):
+            show_subnet_list = False
+            all_nets = None
+
+    if not show_subnet_list:
+        # Show only the current network
+        all_nets = window["single_net"]
+
+    # Return result for template
+    return IpcalcResult(
+        **fields,
+        all_nets=all_nets,
+        parent_desc=window["desc_list"] if show_subnet_list else window["desc_single"],
+        show_subnet_list=show_subnet_list,
+        current_page=current_page,
+        total_subnets=total_subnets if show_subnet_list else len(all_nets.network),
+        window_start_page=start_page if show_subnet_list else 1,
+        window_end_page=end_page if show_subnet_list else 1,
+        current_index=current_index if show_subnet_list else 0,
+    )
 
 
 # ------------------------------------------------------------------